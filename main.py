@@ -1,6 +1,22 @@
 import datetime
+import numpy as np
 import pytz
 from src.illumination_model.scene import IlluminationScene
+from src.illumination_model.atmosphere import AtmosphereModel
+
+# Simulace pro různé počasí
+WEATHER_CONDITIONS = {
+    "Clear (Mountains)": 2.0,
+    "Standard": 3.0,
+    "Light Haze": 5.0,
+    "Overcast/Fog": 20.0
+}
+
+# Preset name -> (turbidity, extinction coefficient), evaluated once at import
+PRESETS = {
+    name: (turbidity, AtmosphereModel.calculate_extinction_coefficient(turbidity))
+    for name, turbidity in WEATHER_CONDITIONS.items()
+}
 
 def main():
     # 1. Scene Setup
@@ -29,21 +45,16 @@ def main():
     print(f"Time:    {now_local.strftime('%Y-%m-%d %H:%M:%S %Z')}")
     print("-" * 40)
     
-    # Simulace pro různé počasí
-    weather_conditions = {
-        "Clear (Mountains)": 2.0,
-        "Standard": 3.0,
-        "Light Haze": 5.0,
-        "Overcast/Fog": 20.0
-    }
+    # Positions are shared by all weather variants, evaluate them in one batch
+    turbidities = np.array([turbidity for turbidity, _ in PRESETS.values()])
+    extinctions = np.array([c for _, c in PRESETS.values()])
+    result = scene.calculate_illumination_batch(lat, lon, elev, t, turbidities, extinction_c=extinctions)
     
-    for weather, turbidity in weather_conditions.items():
-        result = scene.calculate_illumination(lat, lon, elev, t, turbidity)
-        
-        total = result['total_lux']
-        sun = result['sun_lux']
-        moon = result['moon_lux']
-        stars = result['stars_lux']
+    for i, (weather, (turbidity, _)) in enumerate(PRESETS.items()):
+        total = result['total_lux'][i]
+        sun = result['sun_lux'][i]
+        moon = result['moon_lux'][i]
+        stars = result['stars_lux'][i]
         
         print(f"Weather: {weather:<15} (T={turbidity})")
         print(f"  > TOTAL: {total:.5f} Lux")
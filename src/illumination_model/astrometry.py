@@ -1,3 +1,4 @@
+import functools
 import os
 from skyfield.api import load, wgs84, Loader
 from skyfield.timelib import Time
@@ -7,6 +8,26 @@ import numpy as np
 DATA_DIR = os.path.join(os.path.dirname(__file__), '../../../data')
 load = Loader(DATA_DIR)
 
+# Ephemeris and timescale are shared by all engines, loaded on first use
+_PLANETS = None
+_TIMESCALE = None
+
+def _get_planets():
+    """Returns the DE421 ephemeris, loading it only once per process."""
+    global _PLANETS
+    if _PLANETS is None:
+        # If the file does not exist, Skyfield will download it.
+        print("Loading DE421 ephemeris...")
+        _PLANETS = load('de421.bsp')
+    return _PLANETS
+
+def _get_timescale():
+    """Returns the shared Skyfield timescale."""
+    global _TIMESCALE
+    if _TIMESCALE is None:
+        _TIMESCALE = load.timescale()
+    return _TIMESCALE
+
 class ObserverLocation:
     """
     Represents an observer on the Earth's surface
@@ -22,21 +43,45 @@ class ObserverLocation:
         self.elevation = elevation_m
         # Create observer object in WGS84 system
         self.geo_loc = wgs84.latlon(latitude, longitude, elevation_m)
+        # Earth + geo_loc vector sum, built lazily by AstrometryEngine
+        self._topos_cache = None
+
+    @classmethod
+    def from_cached(cls, latitude: float, longitude: float, elevation_m: float = 0.0):
+        """
+        Returns a shared observer for the given location.
+        Coordinates are rounded (~0.1 m, 1 mm) so that equal places reuse
+        one WGS84 position and its cached topos.
+        """
+        return cls._from_rounded(round(latitude, 6), round(longitude, 6), round(elevation_m, 3))
+
+    @classmethod
+    @functools.lru_cache(maxsize=128)
+    def _from_rounded(cls, latitude: float, longitude: float, elevation_m: float):
+        return cls(latitude, longitude, elevation_m)
 
 class AstrometryEngine:
     """
     Handles calculation of celestial body positions (Sun, Moon) for a given time and location.
     Replaces approximation Algorithms 1, 2, and 3 from the original paper with a robust solution.
     """
-    def __init__(self):
-        # Load DE421 ephemeris (includes planets, Sun, Moon)
-        # If the file does not exist, Skyfield will download it.
-        print("Loading DE421 ephemeris...")
-        self.planets = load('de421.bsp')
+    def __init__(self, precise: bool = False):
+        """
+        :param precise: Apply aberration and light deflection (apparent positions).
+                        These shift the Sun/Moon by ~20 arcsec, which is negligible
+                        for illuminance except within a few degrees of the horizon,
+                        where the steep air mass turns it into up to ~2%.
+                        Skipped by default.
+        """
+        self.precise = precise
+        # DE421 ephemeris (includes planets, Sun, Moon)
+        self.planets = _get_planets()
         self.earth = self.planets['earth']
         self.sun = self.planets['sun']
         self.moon = self.planets['moon']
-        self.ts = load.timescale()
+        self.ts = _get_timescale()
+        # Last (observer, time, position) triple, see _observer_at()
+        self._observer_at_cache = None
 
     def get_current_time(self):
         """Returns current Skyfield time."""
@@ -46,6 +91,101 @@ class AstrometryEngine:
         """Creates a time object from UTC date components."""
         return self.ts.utc(year, month, day, hour, minute, second)
 
+    def _observer_topos(self, observer: ObserverLocation):
+        """Returns the barycentric vector sum Earth + observer, cached on the observer."""
+        if observer._topos_cache is None:
+            observer._topos_cache = self.earth + observer.geo_loc
+        return observer._topos_cache
+
+    def _observer_at(self, observer: ObserverLocation, time: Time):
+        """
+        Returns the observer position at given time.
+        Sun and Moon are observed back-to-back from the same place and time,
+        so the last evaluated position is reused.
+        """
+        cached = self._observer_at_cache
+        if cached is not None and cached[0] is observer and cached[1] is time:
+            return cached[2]
+
+        observer_at_t = self._observer_topos(observer).at(time)
+        self._observer_at_cache = (observer, time, observer_at_t)
+        return observer_at_t
+
+    def _quick_altitude(self, observer: ObserverLocation, time: Time, ra_deg, dec_deg):
+        """Geocentric altitude (degrees) of a body given by its equatorial coordinates."""
+        lat = np.radians(observer.latitude)
+        dec = np.radians(dec_deg)
+        hour_angle = np.radians(time.gmst * 15.0 + observer.longitude - ra_deg)
+        sin_alt = np.sin(lat) * np.sin(dec) + np.cos(lat) * np.cos(dec) * np.cos(hour_angle)
+        return np.degrees(np.arcsin(np.clip(sin_alt, -1.0, 1.0)))
+
+    def quick_sun_altitude(self, observer: ObserverLocation, time: Time):
+        """
+        Low precision Sun altitude (~0.01 deg) without ephemeris evaluation.
+        
+        Uses the Astronomical Almanac solar formulas, meant only for a cheap
+        decision whether the Sun can contribute at all.
+        
+        :return: altitude_degrees
+        """
+        n = time.ut1 - 2451545.0
+        mean_lon = np.radians(280.460 + 0.9856474 * n)
+        anomaly = np.radians(357.528 + 0.9856003 * n)
+        ecl_lon = mean_lon + np.radians(1.915 * np.sin(anomaly) + 0.020 * np.sin(2 * anomaly))
+        obliquity = np.radians(23.439 - 0.0000004 * n)
+
+        ra = np.degrees(np.arctan2(np.cos(obliquity) * np.sin(ecl_lon), np.cos(ecl_lon)))
+        dec = np.degrees(np.arcsin(np.sin(obliquity) * np.sin(ecl_lon)))
+        return self._quick_altitude(observer, time, ra, dec)
+
+    def quick_moon_altitude(self, observer: ObserverLocation, time: Time):
+        """
+        Low precision geocentric Moon altitude without ephemeris evaluation.
+        
+        Uses the truncated lunar series of the Astronomical Almanac (~0.5 deg).
+        Parallax is neglected, so the estimate is mostly too high: it lies
+        about -0.2 to +1.5 deg from the true topocentric altitude.
+        
+        :return: altitude_degrees
+        """
+        t = (time.ut1 - 2451545.0) / 36525.0
+
+        def sin_d(phase_deg, rate_deg):
+            """Sine of a periodic term, phase_deg + rate_deg per Julian century."""
+            return np.sin(np.radians(phase_deg + rate_deg * t))
+
+        ecl_lon = np.radians(
+            218.32 + 481267.881 * t
+            + 6.29 * sin_d(135.0, 477198.87) - 1.27 * sin_d(259.3, -413335.36)
+            + 0.66 * sin_d(235.7, 890534.22) + 0.21 * sin_d(269.9, 954397.74)
+            - 0.19 * sin_d(357.5, 35999.05) - 0.11 * sin_d(186.5, 966404.03)
+        )
+        ecl_lat = np.radians(
+            5.13 * sin_d(93.3, 483202.02) + 0.28 * sin_d(228.2, 960400.89)
+            - 0.28 * sin_d(318.3, 6003.15) - 0.17 * sin_d(217.6, -407332.21)
+        )
+
+        # Ecliptic -> equatorial direction cosines (obliquity 23.44 deg)
+        x_eq = np.cos(ecl_lat) * np.cos(ecl_lon)
+        y_eq = 0.9175 * np.cos(ecl_lat) * np.sin(ecl_lon) - 0.3978 * np.sin(ecl_lat)
+        z_eq = 0.3978 * np.cos(ecl_lat) * np.sin(ecl_lon) + 0.9175 * np.sin(ecl_lat)
+
+        ra = np.degrees(np.arctan2(y_eq, x_eq))
+        dec = np.degrees(np.arcsin(z_eq))
+        return self._quick_altitude(observer, time, ra, dec)
+
+    def _altaz(self, observer: ObserverLocation, astrometric):
+        """
+        Converts an astrometric position to (alt, az, distance) in the observer's horizon frame.
+        
+        No refraction is applied in either mode, atmospheric effects are left
+        to AtmosphereModel. Skyfield's altaz() refracts only if temperature_C is given.
+        """
+        if self.precise:
+            return astrometric.apparent().altaz(temperature_C=None)
+        # Geometric direction expressed in the horizon frame of the observer
+        return astrometric.frame_latlon(observer.geo_loc)
+
     def calculate_sun_position(self, observer: ObserverLocation, time: Time):
         """
         Calculates Sun's position in local coordinates (Azimuth, Elevation).
@@ -54,11 +194,9 @@ class AstrometryEngine:
         
         :return: (altitude_degrees, azimuth_degrees, distance_au)
         """
-        observer_topos = self.earth + observer.geo_loc
-        astrometric = observer_topos.at(time).observe(self.sun)
-        apparent = astrometric.apparent()
+        astrometric = self._observer_at(observer, time).observe(self.sun)
         
-        alt, az, distance = apparent.altaz()
+        alt, az, distance = self._altaz(observer, astrometric)
         return alt.degrees, az.degrees, distance.au
 
     def calculate_moon_position(self, observer: ObserverLocation, time: Time):
@@ -69,15 +207,27 @@ class AstrometryEngine:
         
         :return: (altitude_degrees, azimuth_degrees, distance_km)
         """
-        observer_topos = self.earth + observer.geo_loc
-        astrometric = observer_topos.at(time).observe(self.moon)
-        apparent = astrometric.apparent()
+        astrometric = self._observer_at(observer, time).observe(self.moon)
         
-        alt, az, distance = apparent.altaz()
+        alt, az, distance = self._altaz(observer, astrometric)
         return alt.degrees, az.degrees, distance.km
 
+    def calculate_sun_moon_positions(self, observer: ObserverLocation, time: Time):
+        """
+        Calculates positions of both Sun and Moon from a single observer frame.
+        
+        :return: ((sun_alt, sun_az, sun_distance_au), (moon_alt, moon_az, moon_distance_km))
+        """
+        observer_at_t = self._observer_at(observer, time)
+
+        sun_alt, sun_az, sun_distance = self._altaz(observer, observer_at_t.observe(self.sun))
+        moon_alt, moon_az, moon_distance = self._altaz(observer, observer_at_t.observe(self.moon))
+
+        return (
+            (sun_alt.degrees, sun_az.degrees, sun_distance.au),
+            (moon_alt.degrees, moon_az.degrees, moon_distance.km),
+        )
+
     def get_sun_earth_distance_au(self, time: Time):
         """Return distance Earth-Sun for given time."""
-        earth_pos = self.earth.at(time).position.au
-        sun_pos = self.sun.at(time).position.au
-        return np.linalg.norm(np.array(earth_pos) - np.array(sun_pos))
+        return (self.sun - self.earth).at(time).distance().au
@@ -1,5 +1,46 @@
+import functools
+import math
 import numpy as np
 
+
+def _transmittance_kernel(altitude_deg: float, c: float) -> float:
+    """
+    Scalar Beer-Lambert kernel: Kasten-Young air mass followed by e^(-C * m).
+    Uses the math module, NumPy dispatch dominates the cost for single floats.
+    """
+    if altitude_deg <= 0.0:
+        return 0.0
+
+    denominator = math.sin(math.radians(altitude_deg)) + 0.15 * math.pow(altitude_deg + 3.885, -1.253)
+    return math.exp(-c / denominator)
+
+
+def _air_mass_denominator(alt: np.ndarray) -> np.ndarray:
+    """Denominator of the Kasten-Young fit, the air mass is its reciprocal."""
+    # Keep the power base positive, callers mask such samples anyway
+    return np.sin(np.radians(alt)) + 0.15 * np.power(np.maximum(alt + 3.885, 1e-6), -1.253)
+
+
+def _air_mass_vec(altitude_deg: np.ndarray) -> np.ndarray:
+    """
+    Branchless, array variant of AtmosphereModel._calculate_air_mass.
+    Bodies more than 0.5 deg below the horizon get infinite air mass.
+    """
+    alt = np.asarray(altitude_deg, dtype=float)
+    with np.errstate(divide='ignore'):
+        return np.where(alt < -0.5, np.inf, 1.0 / _air_mass_denominator(alt))
+
+
+def _transmittance_vec(altitude_deg: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """
+    Vectorized variant of _transmittance_kernel.
+    Altitudes and extinction coefficients are broadcast against each other.
+    """
+    alt = np.asarray(altitude_deg, dtype=float)
+    # e^(-C * m) with m = 1 / denominator, a single mask handles the horizon
+    return np.where(alt <= 0.0, 0.0, np.exp(-np.asarray(c) / _air_mass_denominator(alt)))
+
+
 class AtmosphereModel:
     """
     Models light transmission through Earth's atmosphere.
@@ -18,6 +59,15 @@ class AtmosphereModel:
     # Ozone absorption coefficient (assumed constant)
     C_OZONE = 0.02975
 
+    # Wavelength dependence of aerosol scattering, lambda^(-1.3) (Eq 17)
+    _AEROSOL_WL_FACTOR = WAVELENGTH_UM ** -1.3
+
+    # Turbidity independent part of the extinction (Rayleigh + Ozone)
+    _C_CONST = C_RAYLEIGH + C_OZONE
+
+    # Air mass at Zenith (altitude 90 deg), constant of the Kasten-Young fit below
+    _M_ZENITH = 1.0 / (1.0 + 0.15 * (90.0 + 3.885) ** -1.253)
+
     def __init__(self):
         pass
 
@@ -31,19 +81,24 @@ class AtmosphereModel:
         Uses robust Kasten-Young approximation (1989), which prevents
         singularity at the horizon (unlike simple 1/sin(a)).
         
-        :param altitude_deg: Object altitude in degrees.
+        :param altitude_deg: Object altitude in degrees (float or array).
         """
+        if np.ndim(altitude_deg) != 0:
+            return _air_mass_vec(altitude_deg)
+
         # Negative altitude (body bellow horizon)
         if altitude_deg < -0.5:
             return float('inf')
+
+        if altitude_deg == 90.0:
+            return AtmosphereModel._M_ZENITH
             
         # Kasten-Young vzorec: 1 / (sin(a) + 0.50572 * (a + 6.07995)^-1.6364)
         # Použijeme raději tvar z článku (Eq 18), pokud je čitelný, 
         # ale Kasten-Young je průmyslový standard pro tento typ simulací.
         # Zde použijeme modifikovanou verzi pro absolutní robustnost u horizontu.
         
-        alpha_rad = np.radians(altitude_deg)
-        zenith_angle = np.radians(90) - alpha_rad
+        alpha_rad = math.radians(altitude_deg)
         
         # Rozenbergova rovnice (často citovaná v papers pro illuminaci)
         # m = 1 / (cos(z) + 0.025 * exp(-11 * cos(z))) 
@@ -52,47 +107,73 @@ class AtmosphereModel:
         # Toto odpovídá vzorci z "Preetham et al." (citace 16 v článku).
         
         # Ochrana proti dělení nulou/komplexním číslům pro velmi nízké úhly
-        denominator = np.sin(alpha_rad) + 0.15 * np.power(altitude_deg + 3.885, -1.253)
+        denominator = math.sin(alpha_rad) + 0.15 * math.pow(altitude_deg + 3.885, -1.253)
         return 1.0 / denominator
 
-    def calculate_extinction_coefficient(self, turbidity: float) -> float:
+    @staticmethod
+    def calculate_extinction_coefficient(turbidity: float) -> float:
         """
         Calculates total extinction coefficient C (Eq 17).
+        Scalar results are memoized, only a handful of turbidities is used in practice.
         
-        :param turbidity: Linke Turbidity Factor.
+        :param turbidity: Linke Turbidity Factor (float or array).
                           2.0 = Very clear (Mountains)
                           3.0 - 5.0 = Clear to Light Haze
                           10+ = Haze / Fog
 
         """
+        if np.ndim(turbidity) != 0:
+            return AtmosphereModel.calculate_extinction_coefficients(turbidity)
+        return AtmosphereModel._extinction_coefficient_cached(turbidity)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _extinction_coefficient_cached(turbidity: float) -> float:
+        """Memoized scalar body of calculate_extinction_coefficient."""
         # 1. Aerosol scattering (Mie) - depends on turbidity
         # Eq 17: C_aerosol = (0.04608 * T - 0.04586) * lambda^(-1.3)
-        c_aerosol = (0.04608 * turbidity - 0.04586) * (self.WAVELENGTH_UM ** -1.3)
+        c_aerosol = (0.04608 * turbidity - 0.04586) * AtmosphereModel._AEROSOL_WL_FACTOR
         
         # Total extinction = Rayleigh + Aerosol + Ozone
-        c_total = self.C_RAYLEIGH + c_aerosol + self.C_OZONE
+        return AtmosphereModel._C_CONST + c_aerosol
+
+    @staticmethod
+    def calculate_extinction_coefficients(turbidities: np.ndarray) -> np.ndarray:
+        """
+        Vectorized variant of calculate_extinction_coefficient (Eq 17).
         
-        return c_total
+        :param turbidities: Array of Linke Turbidity Factors.
+        :return: Array of total extinction coefficients.
+        """
+        turbidities = np.asarray(turbidities, dtype=float)
+        c_aerosol = (0.04608 * turbidities - 0.04586) * AtmosphereModel._AEROSOL_WL_FACTOR
+        return AtmosphereModel._C_CONST + c_aerosol
 
     def get_transmittance(self, altitude_deg: float, turbidity: float = 3.0) -> float:
         """
         Calculates atmospheric transmittance (0.0 to 1.0).
         Applies Beer-Lambert law (Eq 15).
         
-        :param altitude_deg: Source altitude above horizon.
+        :param altitude_deg: Source altitude above horizon (float or array).
         :param turbidity: Atmospheric pollution (default 3.0).
         :return: Transmittance coefficient.
         """
-        if altitude_deg <= 0.0:
-            return 0.0
-            
-        m = self._calculate_air_mass(altitude_deg)
-        c = self.calculate_extinction_coefficient(turbidity)
+        return self._transmit(altitude_deg, self.calculate_extinction_coefficient(turbidity))
+
+    def _transmit(self, altitude_deg: float, c: float) -> float:
+        """
+        Beer-Lambert transmittance for an already evaluated extinction coefficient.
+        Lets callers reuse one coefficient for several sources.
         
+        :param altitude_deg: Source altitude above horizon (float or array).
+        :param c: Total extinction coefficient (float or array,
+                  see calculate_extinction_coefficient).
+        :return: Transmittance coefficient.
+        """
         # Beer-Lambert: Transmittance = e^(-C * m)
-        transmittance = np.exp(-c * m)
-        
-        return transmittance
+        if np.ndim(altitude_deg) == 0 and np.ndim(c) == 0:
+            return _transmittance_kernel(altitude_deg, c)
+        return _transmittance_vec(altitude_deg, c)
 
     @staticmethod
     def visibility_to_turbidity(visibility_km: float) -> float:
@@ -1,3 +1,5 @@
+import functools
+import math
 import numpy as np
 from skyfield.timelib import Time
 from .astrometry import AstrometryEngine, ObserverLocation
@@ -5,6 +7,14 @@ from .sources.sun import SunModel
 from .sources.moon import MoonModel
 from .atmosphere import AtmosphereModel
 
+
+def _projection_factor(altitude_deg):
+    """Projection to horizontal surface: max(0, sin(alt)), scalar or array."""
+    if np.ndim(altitude_deg) == 0:
+        return max(0.0, math.sin(math.radians(altitude_deg)))
+    return np.maximum(0.0, np.sin(np.radians(altitude_deg)))
+
+
 class IlluminationScene:
     """
     Main class for outdoor illumination simulation.
@@ -15,19 +25,69 @@ class IlluminationScene:
     # Derived in paper (Eq 14): 0.00022 / 0.810584 = 0.0002714 lux
     STAR_ILLUMINANCE_EXO_LUX = 0.0002714
 
+    # Bodies below this quick-estimate altitude skip the precise astrometry.
+    # Leaves a wide margin for the error of the low precision formulas.
+    QUICK_SKIP_ALTITUDE_DEG = -5.0
+
     def __init__(self):
         # Initialize subsystems
         self.engine = AstrometryEngine()
         self.sun_model = SunModel()
         self.moon_model = MoonModel(self.engine)
         self.atmos_model = AtmosphereModel()
+        # Astrometry of recent (location, time) pairs, shared by all turbidities
+        self._cached_astrometry = functools.lru_cache(maxsize=64)(self._compute_astrometry)
+        # Moon phase of instants where the Moon was skipped, see calculate_illumination
+        self._cached_phase = functools.lru_cache(maxsize=64)(self._compute_phase)
+
+    def _astrometry(self, observer: ObserverLocation, time: Time):
+        """
+        Evaluates the turbidity independent part of the scene.
+        
+        Bodies which are clearly below the horizon according to the low
+        precision formulas are not observed at all, their altitude is the
+        quick estimate and their extraterrestrial illuminance is zero
+        (it would be multiplied by zero transmittance anyway).
+        
+        If the Moon is observed, its phase angle is taken from the same Time
+        object, reusing the ephemeris positions of the illuminance computation.
+        A skipped Moon has phase None, callers evaluate it only on demand.
+        
+        :return: (sun_alt, sun_exo, moon_alt, moon_exo, moon_phase_deg)
+        """
+        sun_alt = self.engine.quick_sun_altitude(observer, time)
+        moon_alt = self.engine.quick_moon_altitude(observer, time)
+        # For time arrays a body is observed if it may be up at any instant
+        sun_up = np.any(sun_alt > self.QUICK_SKIP_ALTITUDE_DEG)
+        moon_up = np.any(moon_alt > self.QUICK_SKIP_ALTITUDE_DEG)
+
+        if sun_up and moon_up:
+            (sun_alt, _, _), (moon_alt, _, _) = self.engine.calculate_sun_moon_positions(observer, time)
+        elif sun_up:
+            sun_alt, _, _ = self.engine.calculate_sun_position(observer, time)
+        elif moon_up:
+            moon_alt, _, _ = self.engine.calculate_moon_position(observer, time)
+
+        sun_exo = self.sun_model.get_extraterrestrial_illuminance(time) if sun_up else 0.0
+        if not moon_up:
+            moon_exo, moon_phase = 0.0, None
+        elif time.shape == ():
+            moon_exo = self.moon_model.get_extraterrestrial_illuminance(time)
+            moon_phase = math.degrees(self.moon_model.calculate_phase_angle(time))
+        else:
+            moon_exo = self.moon_model.get_extraterrestrial_illuminance_vec(time)
+            moon_phase = np.degrees(self.moon_model.calculate_phase_angle_vec(time))
+
+        return sun_alt, sun_exo, moon_alt, moon_exo, moon_phase
 
     def calculate_illumination(self, 
                              latitude: float, 
                              longitude: float, 
                              elevation_m: float, 
                              time: Time, 
-                             turbidity: float = 3.0) -> dict:
+                             turbidity: float = 3.0,
+                             extinction_c: float = None,
+                             compute_phase: bool = True) -> dict:
         """
         Calculates total scene illumination for a given location and time.
         
@@ -36,33 +96,84 @@ class IlluminationScene:
         :param elevation_m: Elevation (m)
         :param time: Skyfield Time object
         :param turbidity: Atmospheric pollution (default 3.0 = clear)
+        :param extinction_c: Precomputed extinction coefficient, overrides turbidity
+        :param compute_phase: Report moon_phase_angle (None otherwise). When the
+                              Moon is skipped, False avoids any ephemeris evaluation.
+        :return: Dictionary with detailed illumination components (Lux).
+                 For a body more than 5 deg below the horizon
+                 (QUICK_SKIP_ALTITUDE_DEG) sun_altitude / moon_altitude is
+                 only the low precision estimate of AstrometryEngine
+                 (Moon about -0.2 to +1.5 deg off, no parallax); its illuminance is 0.
+        """
+        astro = self._cached_astrometry(latitude, longitude, elevation_m, time.whole, time.tt_fraction)
+        result = self._compute_lux(astro, turbidity, extinction_c)
+        if not compute_phase:
+            result["moon_phase_angle"] = None
+        elif result["moon_phase_angle"] is None:
+            result["moon_phase_angle"] = self._cached_phase(time.whole, time.tt_fraction)
+        return result
+
+    def _compute_astrometry(self,
+                            latitude: float,
+                            longitude: float,
+                            elevation_m: float,
+                            tt_whole: float,
+                            tt_fraction: float) -> tuple:
+        """
+        Turbidity independent part of calculate_illumination, memoized per instance.
+        
+        The time is passed as its exact TT (whole, fraction) pair so that it
+        can serve as a cache key.
+        
+        :return: (sun_alt, sun_exo, moon_alt, moon_exo, moon_phase_deg)
+        """
+        time = self.engine.ts.tt_jd(tt_whole, tt_fraction)
+        observer = ObserverLocation.from_cached(latitude, longitude, elevation_m)
+        return self._astrometry(observer, time)
+
+    def _compute_phase(self, tt_whole: float, tt_fraction: float) -> float:
+        """Moon phase angle in degrees for an instant where the Moon was skipped."""
+        time = self.engine.ts.tt_jd(tt_whole, tt_fraction)
+        return math.degrees(self.moon_model.calculate_phase_angle(time))
+
+    def _compute_lux(self, astro: tuple, turbidity, extinction_c=None) -> dict:
+        """
+        Applies the atmosphere to the astrometry from _astrometry.
+        
+        Shared by all entry points: altitudes may be arrays (time series)
+        and turbidity / extinction_c may be arrays (batch), the terms are
+        broadcast against each other.
+        
         :return: Dictionary with detailed illumination components (Lux)
         """
-        observer = ObserverLocation(latitude, longitude, elevation_m)
+        sun_alt, sun_exo, moon_alt, moon_exo, moon_phase = astro
+
+        # Extinction depends only on turbidity, evaluate it once for all sources
+        if extinction_c is None:
+            c = self.atmos_model.calculate_extinction_coefficient(turbidity)
+        elif np.ndim(extinction_c) != 0:
+            c = np.asarray(extinction_c, dtype=float)
+        else:
+            c = extinction_c
 
         # 1. SUN
-        sun_alt, sun_az, _ = self.engine.calculate_sun_position(observer, time)
-        sun_exo = self.sun_model.get_extraterrestrial_illuminance(time)
-        sun_trans = self.atmos_model.get_transmittance(sun_alt, turbidity)
-        
-        # Projection to horizontal surface: max(0, sin(alt))
-        sun_factor = max(0.0, np.sin(np.radians(sun_alt)))
-        sun_surface = sun_exo * sun_trans * sun_factor
+        sun_surface = sun_exo * self.atmos_model._transmit(sun_alt, c) * _projection_factor(sun_alt)
 
         # 2. MOON
-        moon_alt, moon_az, moon_dist = self.engine.calculate_moon_position(observer, time)
-        moon_exo = self.moon_model.get_extraterrestrial_illuminance(time)
-        moon_trans = self.atmos_model.get_transmittance(moon_alt, turbidity)
-        
-        moon_factor = max(0.0, np.sin(np.radians(moon_alt)))
-        moon_surface = moon_exo * moon_trans * moon_factor
+        moon_surface = moon_exo * self.atmos_model._transmit(moon_alt, c) * _projection_factor(moon_alt)
 
         # 3. STARS
         # Stars pass through the atmosphere.
         # Since they are distributed across the sky, we use Zenith (90 deg)
         # transmittance as a reference for attenuation.
-        stars_trans = self.atmos_model.get_transmittance(90.0, turbidity)
+        if np.ndim(c) == 0:
+            stars_trans = math.exp(-c * AtmosphereModel._M_ZENITH)
+        else:
+            stars_trans = np.exp(-c * AtmosphereModel._M_ZENITH)
         stars_surface = self.STAR_ILLUMINANCE_EXO_LUX * stars_trans
+        # Constant over a time series, expand to the shape of the other terms
+        if np.ndim(sun_surface) > np.ndim(stars_surface):
+            stars_surface = np.full(np.shape(sun_surface), stars_surface)
 
         # 4. TOTAL
         total_lux = sun_surface + moon_surface + stars_surface
@@ -74,5 +185,54 @@ class IlluminationScene:
             "stars_lux": stars_surface,
             "sun_altitude": sun_alt,
             "moon_altitude": moon_alt,
-            "moon_phase_angle": np.degrees(self.moon_model.calculate_phase_angle(time))
+            "moon_phase_angle": moon_phase,
         }
+
+    def calculate_illumination_batch(self,
+                                     latitude: float,
+                                     longitude: float,
+                                     elevation_m: float,
+                                     time: Time,
+                                     turbidities: np.ndarray,
+                                     extinction_c: np.ndarray = None) -> dict:
+        """
+        Calculates scene illumination for several turbidities at once.
+        
+        Sun and Moon positions do not depend on the weather, so they are
+        evaluated only once and the atmosphere is applied as a vector.
+        
+        :param turbidities: Array of turbidity values
+        :param extinction_c: Precomputed extinction coefficients matching turbidities
+        :return: Same keys as calculate_illumination, illuminance entries
+                 are arrays aligned with turbidities. Altitudes of bodies
+                 well below the horizon are approximate, see calculate_illumination.
+        """
+        astro = self._cached_astrometry(latitude, longitude, elevation_m, time.whole, time.tt_fraction)
+        result = self._compute_lux(astro, turbidities, extinction_c)
+        if result["moon_phase_angle"] is None:
+            result["moon_phase_angle"] = self._cached_phase(time.whole, time.tt_fraction)
+        return result
+
+    def calculate_illumination_timeseries(self,
+                                          latitude: float,
+                                          longitude: float,
+                                          elevation_m: float,
+                                          times: Time,
+                                          turbidity: float = 3.0) -> dict:
+        """
+        Calculates scene illumination for a Skyfield Time array (e.g. dusk simulation).
+        
+        Skyfield evaluates the positions for all instants in one call,
+        which is much faster than calling calculate_illumination in a loop.
+        
+        :param times: Skyfield Time object holding N instants
+        :param turbidity: Atmospheric pollution (default 3.0 = clear)
+        :return: Same keys as calculate_illumination, each entry an array of length N.
+                 If a body stays well below the horizon for all instants, its
+                 altitudes are approximate, see calculate_illumination.
+        """
+        observer = ObserverLocation.from_cached(latitude, longitude, elevation_m)
+        result = self._compute_lux(self._astrometry(observer, times), turbidity)
+        if result["moon_phase_angle"] is None:
+            result["moon_phase_angle"] = np.degrees(self.moon_model.calculate_phase_angle_vec(times))
+        return result
@@ -1,7 +1,133 @@
+from collections import namedtuple
+import math
 import numpy as np
-from skyfield.api import position_of_radec, load
+from numpy import sin, cos, log, degrees, clip, arccos
+from scipy.interpolate import CubicSpline
 from skyfield.timelib import Time
-from ..astrometry import AstrometryEngine, ObserverLocation
+from ..astrometry import AstrometryEngine
+
+# Ephemeris positions (km) needed for one evaluation of the Moon model
+MoonPositions = namedtuple('MoonPositions', ['sun_km', 'moon_km', 'earth_km', 'earth_moon_km'])
+
+# Phase angles closer than this to 0 (full Moon) or pi (new Moon) use the limits
+_PHASE_EPSILON = 1e-4
+# Earthshine at full Earth, i.e. the limit of Eq 11 at new Moon (W/m2)
+_EARTHSHINE_FULL_EARTH_WM2 = 0.095
+
+
+def _opposition_surge(phase_angle_rad: float) -> float:
+    """
+    Calculates the brightness surge coefficient at opposition (Full Moon).
+    Implementation of Equation 13.
+    """
+    phi_deg = abs(math.degrees(phase_angle_rad))
+    # 1.27 - 0.045 * (phi - 1), folded
+    val = 1.315 - 0.045 * phi_deg
+    return val if (phi_deg <= 7.0 and val > 1.0) else 1.0
+
+
+def _earthshine_wm2(moon_phase_angle: float) -> float:
+    """
+    Calculates the intensity of Earthshine reaching the Moon in W/m^2.
+    Implementation of Equation 11.
+    """
+    earth_phase_p = math.pi - moon_phase_angle
+
+    if earth_phase_p < _PHASE_EPSILON:
+        # Full Earth (new Moon), the expression tends to 0.095
+        return _EARTHSHINE_FULL_EARTH_WM2
+    if earth_phase_p > (math.pi - _PHASE_EPSILON):
+        return 0.0
+
+    term1 = math.sin(earth_phase_p / 2)
+    term2 = math.tan(earth_phase_p / 2)
+    term3 = math.log(1.0 / math.tan(earth_phase_p / 4))
+
+    # Result is in W/m2 (constant 0.095 derived in paper)
+    e_eas = 0.095 * (1 - term1 * term2 * term3)
+    return max(0.0, e_eas)
+
+
+def _opposition_surge_vec(phase_angle_rad: np.ndarray) -> np.ndarray:
+    """Array variant of _opposition_surge (Eq 13)."""
+    # 1.27 - 0.045 * (phi - 1) = 1.315 - 0.045 * phi reaches 1.0 exactly at 7 deg,
+    # so the clamp alone implements the cutoff
+    return np.maximum(1.315 - 0.045 * np.abs(degrees(phase_angle_rad)), 1.0)
+
+
+def _combined_phase_terms(phi: float):
+    """
+    Phase function for direct sunlight and Earthshine (Eq 11) in one pass.
+    
+    Both use half and quarter angles of phi resp. of the Earth phase pi - phi,
+    which all follow from s = sin(phi/2) and c = cos(phi/2):
+    tan(phi/4) = s / (1 + c), sin((pi-phi)/2) = c, tan((pi-phi)/2) = c / s
+    and tan((pi-phi)/4) = (1 + c - s) / (1 + c + s).
+    
+    Only valid strictly inside (0, pi), the full and new Moon limits are
+    handled by the caller (see _PHASE_EPSILON).
+    
+    :return: (phase_factor, earthshine_wm2)
+    """
+    s = math.sin(phi * 0.5)
+    c = math.cos(phi * 0.5)
+
+    phase_factor = 1 - s * (s / c) * math.log((1.0 + c) / s)
+    # Result is in W/m2 (constant 0.095 derived in paper)
+    e_eas = 0.095 * (1 - c * (c / s) * math.log((1.0 + c + s) / (1.0 + c - s)))
+    return phase_factor, max(0.0, e_eas)
+
+
+def _combined_phase_terms_vec(phi: np.ndarray):
+    """Array variant of _combined_phase_terms."""
+    phi = np.asarray(phi, dtype=float)
+    shape = phi.shape
+    phi = phi.reshape(-1)
+    half = phi * 0.5
+    s = sin(half)
+    c = cos(half, out=half)
+    one_c = c + 1.0
+    # Both branches are evaluated, the ends of the interval produce inf/nan there.
+    # Intermediates are reused in place to keep the number of N-sized
+    # temporaries low (no numexpr dependency needed for this fusion)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # 1 - s^2 / c * ln((1 + c) / s)
+        phase_factor = np.divide(one_c, s)
+        log(phase_factor, out=phase_factor)
+        phase_factor *= s
+        phase_factor *= s
+        phase_factor /= c
+        np.subtract(1.0, phase_factor, out=phase_factor)
+
+        # 0.095 * (1 - c^2 / s * ln((1 + c + s) / (1 + c - s)))
+        e_eas = np.add(one_c, s)
+        one_c -= s
+        e_eas /= one_c
+        log(e_eas, out=e_eas)
+        e_eas *= c
+        e_eas *= c
+        e_eas /= s
+        np.subtract(1.0, e_eas, out=e_eas)
+        e_eas *= 0.095
+
+    full = phi < _PHASE_EPSILON
+    new = phi > (np.pi - _PHASE_EPSILON)
+    np.maximum(e_eas, 0.0, out=e_eas)
+    phase_factor[full] = 1.0
+    phase_factor[new] = 0.0
+    e_eas[full] = 0.0
+    e_eas[new] = _EARTHSHINE_FULL_EARTH_WM2
+    return phase_factor.reshape(shape), e_eas.reshape(shape)
+
+
+def _arccos_clipped(cos_phi) -> np.ndarray:
+    """arccos of a freshly computed cosine array, clipped and evaluated in place."""
+    cos_phi = np.asarray(cos_phi, dtype=float)
+    if cos_phi.ndim == 0:
+        return arccos(clip(cos_phi, -1.0, 1.0))
+    clip(cos_phi, -1.0, 1.0, out=cos_phi)
+    return arccos(cos_phi, out=cos_phi)
+
 
 class MoonModel:
     """
@@ -27,58 +153,78 @@ class MoonModel:
     # Geometric factor for Lambert sphere integration
     LAMBERT_SPHERE_FACTOR = 2.0 / 3.0
 
+    # Earthshine W/m2 -> Lux, ratio of solar constants
+    # (127500 lx / 1300 W/m2) cca 98 lx/(W/m2)
+    _EARTHSHINE_LUX_PER_WM2 = SOLAR_ILLUMINANCE_LUX / SOLAR_IRRADIANCE_WM2
+
+    # Constant part of the final composition, divided by distance^2 per call
+    _LAMBERT_RADIUS_SQ_ALBEDO = LAMBERT_SPHERE_FACTOR * MOON_ALBEDO * MOON_RADIUS_KM**2
+
+    # Number of time vectors kept by get_extraterrestrial_illuminance_vec
+    BATCH_CACHE_SIZE = 16
+
     def __init__(self, astrometry_engine: AstrometryEngine):
         self.engine = astrometry_engine
+        # Ephemeris bodies used in every evaluation
+        self._sun = astrometry_engine.sun
+        self._moon = astrometry_engine.moon
+        self._earth = astrometry_engine.earth
+        # (time, MoonPositions) of the last evaluated time, see _positions()
+        self._positions_cache = None
+        # id(time) -> phase terms of get_extraterrestrial_illuminance_vec
+        self._batch_cache = {}
+        # Splines of the Moon geometry, see prepare_interpolator()
+        self._interp_start = None
+        self._interp_span_days = None
+        self._cos_phi_spline = None
+        self._dist_spline = None
+
+    def _positions(self, time: Time) -> MoonPositions:
+        """
+        Evaluates the ephemeris positions for given time.
+        
+        Phase angle and illuminance are usually requested for the same Time
+        object, so the last result is kept and reused (identity match).
+        """
+        cached = self._positions_cache
+        if cached is not None and cached[0] is time:
+            return cached[1]
+
+        moon_km = self._moon.at(time).position.km
+        earth_km = self._earth.at(time).position.km
+        v_em = moon_km - earth_km
+        positions = MoonPositions(
+            sun_km=self._sun.at(time).position.km,
+            moon_km=moon_km,
+            earth_km=earth_km,
+            # Geometric distance, skipping the light-time iteration of observe().
+            # Differs by up to ~40 km (1e-4 relative, 2e-4 in illuminance).
+            earth_moon_km=np.sqrt(np.einsum('i...,i...->...', v_em, v_em)),
+        )
+        self._positions_cache = (time, positions)
+        return positions
 
     def calculate_phase_angle(self, time: Time) -> float:
         """
         Calculates the Moon phase angle (Sun-Moon-Earth angle).
         0 rad = Full Moon, PI rad = New Moon.
         """
-        sun_pos = self.engine.sun.at(time).position.km
-        moon_pos = self.engine.moon.at(time).position.km
-        earth_pos = self.engine.earth.at(time).position.km
+        pos = self._positions(time)
+        sun_pos, moon_pos, earth_pos = pos.sun_km, pos.moon_km, pos.earth_km
         
         v_me = earth_pos - moon_pos
         v_ms = sun_pos - moon_pos
         
-        v_me_u = v_me / np.linalg.norm(v_me)
-        v_ms_u = v_ms / np.linalg.norm(v_ms)
+        # Flat scalar form, NumPy calls on 3-vectors are dominated by dispatch
+        n_me = math.sqrt(float(v_me[0]*v_me[0] + v_me[1]*v_me[1] + v_me[2]*v_me[2]))
+        n_ms = math.sqrt(float(v_ms[0]*v_ms[0] + v_ms[1]*v_ms[1] + v_ms[2]*v_ms[2]))
+        cos_phi = float(v_me[0]*v_ms[0] + v_me[1]*v_ms[1] + v_me[2]*v_ms[2]) / (n_me * n_ms)
         
-        dot_product = np.dot(v_me_u, v_ms_u)
-        dot_product = np.clip(dot_product, -1.0, 1.0)
-        
-        return np.arccos(dot_product)
+        return math.acos(max(-1.0, min(1.0, cos_phi)))
 
-    def _calculate_opposition_surge(self, phase_angle_rad: float) -> float:
-        """
-        Calculates the brightness surge coefficient at opposition (Full Moon).
-        Implementation of Equation 13.
-        """
-        phi_deg = np.degrees(phase_angle_rad)
-        if phi_deg <= 7.0:
-            val = 1.27 - 0.045 * (abs(phi_deg) - 1)
-            return max(val, 1.0)
-        return 1.0
-
-    def _calculate_earthshine_wm2(self, moon_phase_angle: float) -> float:
-        """
-        Calculates the intensity of Earthshine reaching the Moon in W/m^2.
-        Implementation of Equation 11.
-        """
-        earth_phase_p = np.pi - moon_phase_angle
-        epsilon = 1e-4
-        
-        if earth_phase_p < epsilon or earth_phase_p > (np.pi - epsilon):
-             return 0.0
-
-        term1 = np.sin(earth_phase_p / 2)
-        term2 = np.tan(earth_phase_p / 2)
-        term3 = np.log(1.0 / np.tan(earth_phase_p / 4))
-        
-        # Result is in W/m2 (constant 0.095 derived in paper)
-        e_eas = 0.095 * (1 - term1 * term2 * term3)
-        return max(0.0, e_eas)
+    # Stateless helpers live at module level, kept here for existing callers
+    _calculate_opposition_surge = staticmethod(_opposition_surge)
+    _calculate_earthshine_wm2 = staticmethod(_earthshine_wm2)
 
     def get_extraterrestrial_illuminance(self, time: Time) -> float:
         """
@@ -86,39 +232,142 @@ class MoonModel:
         Combines direct Sun reflection and Earthshine.
         """
         phi = self.calculate_phase_angle(time)
-        dist_km = self.engine.earth.at(time).observe(self.engine.moon).distance().km
+        dist_km = self._positions(time).earth_moon_km
         
         # Opposition Surge
-        o_eff = self._calculate_opposition_surge(phi)
+        o_eff = _opposition_surge(phi)
         
-        # Phase function for direct sunlight
-        epsilon = 1e-4
-        if phi < epsilon:
-            phase_factor = 1.0
-        elif phi > (np.pi - epsilon):
-            phase_factor = 0.0
+        # Phase function for direct sunlight and Earthshine (W/m2),
+        # full and new Moon decided once here
+        if phi < _PHASE_EPSILON:
+            phase_factor, e_earthshine_wm2 = 1.0, 0.0
+        elif phi > (math.pi - _PHASE_EPSILON):
+            phase_factor, e_earthshine_wm2 = 0.0, _EARTHSHINE_FULL_EARTH_WM2
         else:
-            term1 = np.sin(phi / 2)
-            term2 = np.tan(phi / 2)
-            term3 = np.log(1.0 / np.tan(phi / 4))
-            phase_factor = 1 - term1 * term2 * term3
+            phase_factor, e_earthshine_wm2 = _combined_phase_terms(phi)
         
         # 1. Direct reflected Sunlight (Lux)
         e_reflected_sun = self.SOLAR_ILLUMINANCE_LUX * phase_factor
         
-        # 2. Earthshine (W/m2 -> Lux)
-        # First get W/m2 value
-        e_earthshine_wm2 = self._calculate_earthshine_wm2(phi)
-        # Convert to Lux using the ratio of solar constants
-        # (127500 lx / 1300 W/m2) cca 98 lx/(W/m2)
-        conversion_ratio = self.SOLAR_ILLUMINANCE_LUX / self.SOLAR_IRRADIANCE_WM2
-        e_earthshine_lux = e_earthshine_wm2 * conversion_ratio
-
-        # Final composition
-        geometry_factor = (self.MOON_RADIUS_KM / dist_km)**2
+        # 2. Earthshine (W/m2 -> Lux) and final composition
+        return self._LAMBERT_RADIUS_SQ_ALBEDO * o_eff / (dist_km * dist_km) * (
+            e_reflected_sun + e_earthshine_wm2 * self._EARTHSHINE_LUX_PER_WM2
+        )
+
+    def calculate_phase_angle_vec(self, time: Time) -> np.ndarray:
+        """
+        Vectorized calculate_phase_angle for a Time holding N instants.
+        
+        Each body is evaluated once for all instants, positions stay in
+        Skyfield's (3, N) layout and are reduced over the first axis.
+        """
+        return _arccos_clipped(self._cos_phase_angle_vec(time))
+
+    def _cos_phase_angle_vec(self, time: Time) -> np.ndarray:
+        """Cosine of the phase angle (unclipped) for a Time holding N instants."""
+        pos = self._positions(time)
+        sun_pos, moon_pos, earth_pos = pos.sun_km, pos.moon_km, pos.earth_km
+
+        v_me = earth_pos - moon_pos
+        v_ms = sun_pos - moon_pos
+
+        n_me = np.sqrt(np.einsum('i...,i...->...', v_me, v_me))
+        n_ms = np.sqrt(np.einsum('i...,i...->...', v_ms, v_ms))
+        return np.einsum('i...,i...->...', v_me, v_ms) / (n_me * n_ms)
+
+    def get_extraterrestrial_illuminance_vec(self, time: Time) -> np.ndarray:
+        """
+        Vectorized get_extraterrestrial_illuminance for a Time holding N instants.
+        
+        Geometry and phase terms are cached per Time object (see clear_cache),
+        repeated calls over the same time vector only recompose the result.
         
-        total_illuminance = (
-            self.LAMBERT_SPHERE_FACTOR * self.MOON_ALBEDO * o_eff * geometry_factor * (e_reflected_sun + e_earthshine_lux)
+        :return: Array of illuminances in lux
+        """
+        entry = self._batch_cache.get(id(time))
+        if entry is None or entry['time'] is not time:
+            phi = self.calculate_phase_angle_vec(time)
+            phase_factor, e_earthshine_wm2 = _combined_phase_terms_vec(phi)
+            entry = {
+                # Keeps the Time alive so its id() cannot be reused
+                'time': time,
+                'phi': phi,
+                'dist_km': self._positions(time).earth_moon_km,
+                'o_eff': _opposition_surge_vec(phi),
+                'phase_factor': phase_factor,
+                'earthshine_wm2': e_earthshine_wm2,
+            }
+            if len(self._batch_cache) >= self.BATCH_CACHE_SIZE:
+                # Dicts keep insertion order, drop the oldest entry
+                del self._batch_cache[next(iter(self._batch_cache))]
+            self._batch_cache[id(time)] = entry
+
+        return self._compose_illuminance(
+            entry['o_eff'], entry['dist_km'], entry['phase_factor'], entry['earthshine_wm2']
+        )
+
+    def clear_cache(self):
+        """Drops cached positions and batch phase terms."""
+        self._positions_cache = None
+        self._batch_cache.clear()
+
+    def _illuminance_vec(self, phi: np.ndarray, dist_km: np.ndarray) -> np.ndarray:
+        """Illuminance (lux) from phase angle and Earth-Moon distance arrays."""
+        phase_factor, e_earthshine_wm2 = _combined_phase_terms_vec(phi)
+        return self._compose_illuminance(
+            _opposition_surge_vec(phi), dist_km, phase_factor, e_earthshine_wm2
         )
+
+    def _compose_illuminance(self, o_eff, dist_km, phase_factor, e_earthshine_wm2):
+        """Final composition (lux) of the precomputed phase terms."""
+        e_reflected_sun = self.SOLAR_ILLUMINANCE_LUX * phase_factor
+
+        return self._LAMBERT_RADIUS_SQ_ALBEDO * o_eff / (dist_km * dist_km) * (
+            e_reflected_sun + e_earthshine_wm2 * self._EARTHSHINE_LUX_PER_WM2
+        )
+
+    def prepare_interpolator(self, t_start: Time, t_end: Time, dt_minutes: float = 15.0):
+        """
+        Prepares spline interpolation of the Moon geometry for
+        get_extraterrestrial_illuminance_fast.
+        
+        The phase angle changes ~12 deg/day, so nodes every 15 minutes keep
+        the interpolation error far below the model accuracy while the
+        ephemeris is evaluated only at the nodes. The cosine of the phase
+        angle is interpolated, it stays smooth even through Full Moon.
         
-        return total_illuminance
+        :param t_start: Start of the interval
+        :param t_end: End of the interval
+        :param dt_minutes: Node spacing in minutes
+        """
+        span_days = (t_end.whole - t_start.whole) + (t_end.tt_fraction - t_start.tt_fraction)
+        if span_days <= 0.0:
+            raise ValueError("Interval given to prepare_interpolator() is empty, t_end must be after t_start.")
+        n_nodes = max(int(np.ceil(span_days * 1440.0 / dt_minutes)) + 1, 4)
+        offsets = np.linspace(0.0, span_days, n_nodes)
+        nodes = self.engine.ts.tt_jd(t_start.whole, t_start.tt_fraction + offsets)
+
+        cos_phi = self._cos_phase_angle_vec(nodes)
+        dist_km = self._positions(nodes).earth_moon_km
+
+        self._interp_start = t_start
+        self._interp_span_days = span_days
+        self._cos_phi_spline = CubicSpline(offsets, cos_phi)
+        self._dist_spline = CubicSpline(offsets, dist_km)
+
+    def get_extraterrestrial_illuminance_fast(self, time: Time) -> np.ndarray:
+        """
+        Illuminance (lux) evaluated from the splines of prepare_interpolator,
+        no ephemeris access. Use get_extraterrestrial_illuminance for single
+        exact evaluations.
+        """
+        if self._cos_phi_spline is None:
+            raise RuntimeError("Call prepare_interpolator() first.")
+
+        start = self._interp_start
+        x = (time.whole - start.whole) + (time.tt_fraction - start.tt_fraction)
+        if np.any(x < 0.0) or np.any(x > self._interp_span_days):
+            raise ValueError("Time is outside the interval given to prepare_interpolator().")
+
+        phi = _arccos_clipped(self._cos_phi_spline(x))
+        return self._illuminance_vec(phi, self._dist_spline(x))
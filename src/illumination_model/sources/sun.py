@@ -1,4 +1,5 @@
 import numpy as np
+from numpy import cos
 from skyfield.timelib import Time
 
 class SunModel:
@@ -12,6 +13,10 @@ class SunModel:
     # Eccentricity of Earth's orbit
     ECCENTRICITY = 0.01672
 
+    # Constant parts of Equation (9)
+    _TWO_PI_OVER_YEAR = 2 * np.pi / 365.2
+    _INV_DENOM = 1.0 / (1 - ECCENTRICITY**2)
+
     def __init__(self):
         pass
 
@@ -22,7 +27,7 @@ class SunModel:
         
         Based on Equation (9) in Undeger (2009).
         
-        :param time: Skyfield Time object
+        :param time: Skyfield Time object (scalar or array)
         :return: Illuminance in lux (lx)
         """
         # Get Julian Date (tt = Terrestrial Time)
@@ -30,10 +35,8 @@ class SunModel:
         
         # Implementation of Equation (9)
         # E_ST = E_SC * ((1 + e * cos(2pi(JD-2)/365.2))^2) / (1-e^2)
-        term = np.cos(2 * np.pi * (jd - 2) / 365.2)
-        numerator = (1 + self.ECCENTRICITY * term)**2
-        denominator = 1 - (self.ECCENTRICITY**2)
-        
-        e_st = self.SOLAR_CONSTANT_LUX * (numerator / denominator)
+        # Exact cos is kept, a day-of-year table would add up to 0.16 lx error
+        term = cos(self._TWO_PI_OVER_YEAR * (jd - 2.0))
+        f = 1.0 + self.ECCENTRICITY * term
         
-        return e_st
+        return self.SOLAR_CONSTANT_LUX * (f * f) * self._INV_DENOM
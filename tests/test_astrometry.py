@@ -39,3 +39,45 @@ def test_moon_distance(engine, prague_observer):
     
     # Měsíc je vzdálen 360 000 km až 405 000 km
     assert 350_000 < dist_km < 410_000, f"Vzdálenost Měsíce {dist_km} km je nesmyslná."
+
+def test_sun_moon_positions_combined(engine, prague_observer):
+    """Společný výpočet Slunce a Měsíce musí odpovídat samostatným voláním."""
+    t = engine.get_time_from_utc(2024, 10, 17, 23, 0, 0)
+
+    sun, moon = engine.calculate_sun_moon_positions(prague_observer, t)
+
+    assert sun == pytest.approx(engine.calculate_sun_position(prague_observer, t))
+    assert moon == pytest.approx(engine.calculate_moon_position(prague_observer, t))
+
+def test_quick_altitudes(engine, prague_observer):
+    """Rychlé odhady výšky musí být blízko přesného výpočtu."""
+    t = engine.get_time_from_utc(2024, 10, 17, 23, 0, 0)
+
+    sun_alt, _, _ = engine.calculate_sun_position(prague_observer, t)
+    moon_alt, _, _ = engine.calculate_moon_position(prague_observer, t)
+
+    assert abs(engine.quick_sun_altitude(prague_observer, t) - sun_alt) < 0.05
+    # Bez paralaxy je geocentrická výška Měsíce většinou vyšší (cca -0.2 až +1.5 stupně)
+    assert -0.5 < engine.quick_moon_altitude(prague_observer, t) - moon_alt < 1.5
+
+def test_precise_mode_difference(prague_observer):
+    """Zjednodušené (geometrické) polohy se od přesných liší jen o desítky obloukových vteřin."""
+    fast = AstrometryEngine()
+    precise = AstrometryEngine(precise=True)
+    t = fast.get_time_from_utc(2025, 6, 21, 11, 0, 0)
+
+    alt_fast, az_fast, _ = fast.calculate_sun_position(prague_observer, t)
+    alt_precise, az_precise, _ = precise.calculate_sun_position(prague_observer, t)
+
+    assert abs(alt_fast - alt_precise) < 0.01
+    assert abs(az_fast - az_precise) < 0.02
+
+def test_observer_from_cached():
+    """Stejné místo vrací sdílený objekt pozorovatele."""
+    a = ObserverLocation.from_cached(50.0755, 14.4378, 200.0)
+    b = ObserverLocation.from_cached(50.0755, 14.4378, 200)
+    c = ObserverLocation.from_cached(49.0, 14.4378, 200.0)
+
+    assert a is b
+    assert a is not c
+    assert a.latitude == 50.0755
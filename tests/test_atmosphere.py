@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 from illumination_model.atmosphere import AtmosphereModel
 
 @pytest.fixture
@@ -45,3 +46,26 @@ def test_transmittance_reduction(atmos):
     
     assert trans_clean > trans_haze
     assert trans_clean < 1.0 # Nikdy nepropustí 100%
+
+def test_air_mass_zenith_constant(atmos):
+    """Předpočítaná konstanta pro zenit musí navazovat na obecný vzorec."""
+    m_zenith = atmos._calculate_air_mass(90.0)
+    m_near = atmos._calculate_air_mass(89.9999)
+    assert m_zenith == AtmosphereModel._M_ZENITH
+    assert abs(m_zenith - m_near) < 1e-6
+
+def test_air_mass_array(atmos):
+    """Vektorová verze air mass musí odpovídat skalární včetně hodnot pod obzorem."""
+    altitudes = np.array([-10.0, -0.2, 0.0, 10.0, 45.0, 90.0])
+    m = atmos._calculate_air_mass(altitudes)
+    expected = [atmos._calculate_air_mass(float(a)) for a in altitudes]
+    assert m == pytest.approx(expected)
+
+    trans = atmos.get_transmittance(altitudes, turbidity=3.0)
+    assert trans == pytest.approx([atmos.get_transmittance(float(a), 3.0) for a in altitudes])
+
+def test_transmittance_turbidity_array(atmos):
+    """Pole turbidit musí dávat stejné hodnoty jako skalární volání."""
+    turbidities = np.array([2.0, 3.0, 5.0])
+    trans = atmos.get_transmittance(30.0, turbidities)
+    assert trans == pytest.approx([atmos.get_transmittance(30.0, float(t)) for t in turbidities])
@@ -70,3 +70,51 @@ def test_opposition_surge_logic(moon_model):
     # Úhel 8 stupňů -> Žádný surge (1.0)
     val_8 = moon_model._calculate_opposition_surge(np.radians(8.0))
     assert val_8 == 1.0
+
+def test_earthshine_new_moon_limit(moon_model):
+    """Earthshine je v novu maximální (plná Země) a spojitě navazuje na okolí."""
+    near_new = moon_model._calculate_earthshine_wm2(np.pi - 2e-4)
+    assert moon_model._calculate_earthshine_wm2(np.pi) == pytest.approx(near_new, rel=1e-6)
+    assert moon_model._calculate_earthshine_wm2(0.0) == 0.0
+
+def test_vectorized_matches_scalar(engine, moon_model):
+    """Vektorová verze (celý měsíc po dnech) musí odpovídat skalárním výpočtům."""
+    times = engine.ts.utc(2024, 10, range(1, 32), 12, 0, 0)
+
+    lux_vec = moon_model.get_extraterrestrial_illuminance_vec(times)
+    phi_vec = moon_model.calculate_phase_angle_vec(times)
+
+    assert lux_vec.shape == (31,)
+    for i, t in enumerate(times):
+        assert phi_vec[i] == pytest.approx(moon_model.calculate_phase_angle(t), rel=1e-9)
+        assert lux_vec[i] == pytest.approx(moon_model.get_extraterrestrial_illuminance(t), rel=1e-9)
+
+def test_batch_cache(engine, moon_model):
+    """Opakované volání pro stejný Time použije cache, clear_cache ji vyprázdní."""
+    times = engine.ts.utc(2024, 10, range(1, 11), 12, 0, 0)
+
+    first = moon_model.get_extraterrestrial_illuminance_vec(times)
+    assert id(times) in moon_model._batch_cache
+    second = moon_model.get_extraterrestrial_illuminance_vec(times)
+    assert second == pytest.approx(first, rel=1e-12)
+
+    moon_model.clear_cache()
+    assert not moon_model._batch_cache
+
+def test_interpolator_matches_exact(engine, moon_model):
+    """Interpolace přes úplněk musí odpovídat přesnému výpočtu."""
+    t_start = engine.get_time_from_utc(2024, 10, 16, 0, 0, 0)
+    t_end = engine.get_time_from_utc(2024, 10, 19, 0, 0, 0)
+    moon_model.prepare_interpolator(t_start, t_end, dt_minutes=15)
+
+    times = engine.ts.utc(2024, 10, 16, range(0, 72, 5), 7, 0)
+    exact = moon_model.get_extraterrestrial_illuminance_vec(times)
+    fast = moon_model.get_extraterrestrial_illuminance_fast(times)
+
+    assert fast == pytest.approx(exact, rel=1e-6)
+
+    with pytest.raises(ValueError):
+        moon_model.get_extraterrestrial_illuminance_fast(engine.get_time_from_utc(2024, 10, 20, 0, 0, 0))
+
+    with pytest.raises(ValueError):
+        moon_model.prepare_interpolator(t_end, t_start)
@@ -0,0 +1,79 @@
+import pytest
+import numpy as np
+from illumination_model.scene import IlluminationScene
+
+@pytest.fixture(scope="module")
+def scene():
+    return IlluminationScene()
+
+def test_batch_matches_scalar(scene):
+    """
+    Dávkový výpočet přes více turbidit musí dát stejné výsledky
+    jako opakované volání skalární verze.
+    """
+    t = scene.engine.get_time_from_utc(2025, 6, 21, 11, 0, 0)
+    turbidities = np.array([2.0, 3.0, 5.0, 20.0])
+
+    batch = scene.calculate_illumination_batch(50.0755, 14.4378, 200.0, t, turbidities)
+
+    for i, turbidity in enumerate(turbidities):
+        single = scene.calculate_illumination(50.0755, 14.4378, 200.0, t, turbidity)
+        for key in ("total_lux", "sun_lux", "moon_lux", "stars_lux"):
+            assert batch[key][i] == pytest.approx(single[key], rel=1e-12)
+
+def test_timeseries_matches_scalar(scene):
+    """Časová řada (soumrak) musí odpovídat jednotlivým skalárním výpočtům."""
+    ts = scene.engine.ts
+    times = ts.utc(2024, 10, 17, 15, range(0, 240, 30))
+
+    series = scene.calculate_illumination_timeseries(50.0755, 14.4378, 200.0, times, 3.0)
+
+    assert series["total_lux"].shape == (len(times),)
+    for i, t in enumerate(times):
+        single = scene.calculate_illumination(50.0755, 14.4378, 200.0, t, 3.0)
+        for key in ("total_lux", "sun_lux", "moon_lux", "stars_lux"):
+            assert series[key][i] == pytest.approx(single[key], rel=1e-9, abs=1e-12)
+        # Hluboko pod obzorem může skalární verze vrátit jen rychlý odhad výšky
+        assert series["sun_altitude"][i] == pytest.approx(single["sun_altitude"], abs=0.05)
+
+def test_astrometry_cache_reused(scene):
+    """Opakovaný výpočet pro stejné místo a čas nesmí znovu počítat polohy."""
+    t = scene.engine.get_time_from_utc(2024, 10, 17, 23, 0, 0)
+    scene._cached_astrometry.cache_clear()
+
+    first = scene.calculate_illumination(50.0755, 14.4378, 200.0, t, 2.0)
+    second = scene.calculate_illumination(50.0755, 14.4378, 200.0, t, 2.0)
+    scene.calculate_illumination(50.0755, 14.4378, 200.0, t, 20.0)
+
+    info = scene._cached_astrometry.cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+    assert first == second
+
+def test_phase_optional(scene):
+    """Při compute_phase=False se fázový úhel nevrací, jinak odpovídá MoonModel."""
+    t = scene.engine.get_time_from_utc(2024, 10, 2, 18, 49, 0)
+
+    without = scene.calculate_illumination(50.0755, 14.4378, 200.0, t, 3.0, compute_phase=False)
+    with_phase = scene.calculate_illumination(50.0755, 14.4378, 200.0, t, 3.0)
+
+    assert without["moon_phase_angle"] is None
+    assert with_phase["moon_phase_angle"] == pytest.approx(
+        np.degrees(scene.moon_model.calculate_phase_angle(t)), rel=1e-9)
+    assert without["total_lux"] == with_phase["total_lux"]
+
+def test_phase_lazy_when_moon_down(scene, monkeypatch):
+    """Pod obzorem se Měsíc při compute_phase=False vůbec nepočítá z efemerid."""
+    t = scene.engine.get_time_from_utc(2024, 10, 2, 21, 0, 0)
+    calls = []
+    positions = scene.moon_model._positions
+    monkeypatch.setattr(scene.moon_model, "_positions", lambda time: calls.append(time) or positions(time))
+
+    result = scene.calculate_illumination(50.0755, 14.4378, 200.0, t, 3.0, compute_phase=False)
+    assert result["moon_lux"] == 0.0
+    assert result["moon_phase_angle"] is None
+    assert not calls
+
+    with_phase = scene.calculate_illumination(50.0755, 14.4378, 200.0, t, 3.0)
+    assert with_phase["moon_phase_angle"] == pytest.approx(
+        np.degrees(scene.moon_model.calculate_phase_angle(t)), rel=1e-9)